@@ -1,8 +1,85 @@
 # esp32_client.py
 import requests
+from requests.adapters import HTTPAdapter
+import urllib3
+from urllib3.connection import HTTPConnection
+import atexit
 import json
+import socket
+import struct
+import sys
 import time
-from typing import Dict, Any, Optional
+from http.cookiejar import DefaultCookiePolicy
+from urllib.parse import urlsplit
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple, Union
+
+try:
+    import orjson  # 可选：C实现的JSON库，解析更快
+except ImportError:
+    orjson = None
+
+try:
+    import ijson  # 可选：流式JSON解析，只提取需要的字段
+except ImportError:
+    ijson = None
+
+try:
+    import websocket  # 可选：websocket-client，用于推送式传感器监控
+except ImportError:
+    websocket = None
+
+# 传感器数据中客户端实际使用的字段
+SENSOR_FIELDS = ("analog_value", "voltage", "button_pressed", "led_state", "relay_state")
+
+# /api/sensor/bin 的二进制格式（与固件SensorPacket一致）：小端 uint16 模拟值, float 电压, 3个bool
+SENSOR_BIN_FORMAT = struct.Struct("<Hf???")
+
+# 控制操作 -> API端点
+_LED_URLS = {"on": "/api/led/on", "off": "/api/led/off", "toggle": "/api/led/toggle"}
+_RELAY_URLS = {"on": "/api/relay/on", "off": "/api/relay/off"}
+
+# ESP32 WebSocket推送服务端口（与固件一致）
+WS_PORT = 81
+
+# WebSocket接收超时（秒）：超时后发ping探测，下一个超时内仍无任何帧则判定设备无响应
+WS_RECV_TIMEOUT = 10
+
+# 监控行模板及按钮/开关状态文字
+_MON_FMT = "\r🕒 {ts} - 模拟值: {a:>4} | 电压: {v:.2f}V | 按钮: {btn:3s} | LED: {led:3s} | 继电器: {relay:3s}"
+_BUTTON_TEXT = ("释放", "按下")
+_SWITCH_TEXT = ("关闭", "开启")
+
+# 监控输出的最短刷新间隔（秒），高频轮询时合并多次写入
+MONITOR_FLUSH_INTERVAL = 0.1
+
+# TCP保活探测：空闲多少秒后开始探测、探测间隔（秒）、失败几次判定断开
+TCP_KEEPALIVE_IDLE = 30
+TCP_KEEPALIVE_INTERVAL = 10
+TCP_KEEPALIVE_COUNT = 3
+
+def _keepalive_socket_options() -> List[Tuple[int, int, int]]:
+    """在urllib3默认选项（已包含TCP_NODELAY）基础上开启TCP保活，平台支持时缩短探测时间"""
+    options = HTTPConnection.default_socket_options + [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+    for name, value in (("TCP_KEEPIDLE", TCP_KEEPALIVE_IDLE),
+                        ("TCP_KEEPINTVL", TCP_KEEPALIVE_INTERVAL),
+                        ("TCP_KEEPCNT", TCP_KEEPALIVE_COUNT)):
+        if hasattr(socket, name):
+            options.append((socket.IPPROTO_TCP, getattr(socket, name), value))
+    return options
+
+class _TCPAdapter(HTTPAdapter):
+    """开启TCP保活的HTTPAdapter，尽早发现被ESP32关闭的空闲连接"""
+    
+    SOCKET_OPTIONS = _keepalive_socket_options()
+    
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["socket_options"] = self.SOCKET_OPTIONS
+        super().init_poolmanager(*args, **kwargs)
+
+# 所有控制器实例共享的连接池（每台设备一个子池），控制多台ESP32时互相复用
+_SHARED_ADAPTER = _TCPAdapter(pool_connections=16, pool_maxsize=4, max_retries=0)
+atexit.register(_SHARED_ADAPTER.close)
 
 class ESP32Controller:
     """
@@ -21,19 +98,93 @@ class ESP32Controller:
             base_url = 'http://' + base_url
         self.base_url = base_url.rstrip('/')
         self.timeout = timeout
+        parts = urlsplit(self.base_url)
+        ws_scheme = "wss" if parts.scheme == "https" else "ws"
+        self.ws_url = f"{ws_scheme}://{parts.hostname}:{WS_PORT}/ws/sensor"
         self.session = requests.Session()
+        # 复用共享连接池中的TCP连接，避免每次请求重新握手
+        self.session.mount("http://", _SHARED_ADAPTER)
+        self.session.mount("https://", _SHARED_ADAPTER)
+        # ESP32不使用Cookie，拒绝保存以免请求间携带状态
+        self.session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        # ESP32响应很小，关闭gzip协商
+        self.session.headers.update({
+            "Connection": "keep-alive",
+            "Accept": "application/json",
+            "Accept-Encoding": "identity"
+        })
+        # 单线程打印队列：格式化输出与下一个请求重叠，且保持打印顺序
+        # GET响应缓存: 端点 -> (时间戳, 响应)，TTL为0表示不缓存
+        self._cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._ttl: Dict[str, float] = {
+            "/api/device/info": 60.0,
+            "/api/sensor/data": 0.0
+        }
+        # 固件是否支持合并的 /api/status 端点，返回404后不再尝试
+        self._batch_status = True
         
+    def _get(self, endpoint: str, **kwargs) -> Union[requests.Response, Dict[str, Any]]:
+        """发送GET请求，状态码为200时返回响应对象，否则返回错误字典"""
+        try:
+            response = self.session.get(f"{self.base_url}{endpoint}", timeout=self.timeout, **kwargs)
+        except requests.exceptions.RequestException as e:
+            return {"error": True, "message": f"请求失败: {e}"}
+        
+        # 直接判断状态码，成功路径上不抛出异常
+        if response.status_code != 200:
+            response.close()
+            return {"error": True, "message": f"请求失败: HTTP {response.status_code}",
+                    "status_code": response.status_code}
+        return response
+    
     def _send_request(self, endpoint: str) -> Dict[str, Any]:
         """发送HTTP请求到ESP32"""
+        ttl = self._ttl.get(endpoint, 0)
+        if ttl > 0:
+            cached = self._cache.get(endpoint)
+            if cached is not None and time.monotonic() - cached[0] < ttl:
+                return cached[1]
+        
+        response = self._get(endpoint)
+        if isinstance(response, dict):
+            return response
+        
         try:
-            url = f"{self.base_url}{endpoint}"
-            response = self.session.get(url, timeout=self.timeout)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
+            result = orjson.loads(response.content) if orjson else response.json()
+        except ValueError as e:  # 各JSON库的JSONDecodeError都是ValueError的子类
+            return {"error": True, "message": f"JSON解析失败: {e}"}
+        
+        if ttl > 0 and "error" not in result:
+            self._cache[endpoint] = (time.monotonic(), result)
+        return result
+    
+    def _stream_fields(self, endpoint: str, fields: Tuple[str, ...]) -> Dict[str, Any]:
+        """流式解析响应，只提取指定的顶层字段，集齐后即停止解析"""
+        response = self._get(endpoint, stream=True)
+        if isinstance(response, dict):
+            return response
+        
+        try:
+            with response:
+                response.raw.decode_content = True
+                result = {}
+                for key, value in ijson.kvitems(response.raw, "", use_float=True):
+                    if key in fields:
+                        result[key] = value
+                        if len(result) == len(fields):
+                            break
+                # 读完剩余字节（不解析），连接才能放回连接池复用
+                while response.raw.read(8192):
+                    pass
+        except (requests.exceptions.RequestException, urllib3.exceptions.HTTPError) as e:
             return {"error": True, "message": f"请求失败: {e}"}
-        except json.JSONDecodeError as e:
+        except ijson.JSONError as e:
             return {"error": True, "message": f"JSON解析失败: {e}"}
+        
+        missing = [field for field in fields if field not in result]
+        if missing:
+            return {"error": True, "message": f"响应不是JSON对象或缺少字段: {missing}"}
+        return result
     
     def get_device_info(self) -> Dict[str, Any]:
         """获取设备信息"""
@@ -46,10 +197,10 @@ class ESP32Controller:
         Args:
             action: 'on', 'off', 'toggle'
         """
-        valid_actions = ['on', 'off', 'toggle']
-        if action not in valid_actions:
-            return {"error": True, "message": f"无效的操作，请使用: {valid_actions}"}
-        return self._send_request(f"/api/led/{action}")
+        endpoint = _LED_URLS.get(action)
+        if endpoint is None:
+            return {"error": True, "message": f"无效的操作，请使用: {list(_LED_URLS)}"}
+        return self._send_request(endpoint)
     
     def relay_control(self, action: str) -> Dict[str, Any]:
         """
@@ -58,17 +209,56 @@ class ESP32Controller:
         Args:
             action: 'on', 'off'
         """
-        valid_actions = ['on', 'off']
-        if action not in valid_actions:
-            return {"error": True, "message": f"无效的操作，请使用: {valid_actions}"}
-        return self._send_request(f"/api/relay/{action}")
+        endpoint = _RELAY_URLS.get(action)
+        if endpoint is None:
+            return {"error": True, "message": f"无效的操作，请使用: {list(_RELAY_URLS)}"}
+        return self._send_request(endpoint)
     
     def get_sensor_data(self) -> Dict[str, Any]:
         """获取传感器数据"""
+        if ijson:
+            return self._stream_fields("/api/sensor/data", SENSOR_FIELDS)
         return self._send_request("/api/sensor/data")
     
+    def wait_for(self, field: str, expected: Any, timeout: float = 1.0) -> bool:
+        """轮询传感器数据，直到指定字段变为期望值或超时"""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if self.get_sensor_data().get(field) == expected:
+                return True
+            time.sleep(0.01)
+        return False
+    
+    def get_sensor_data_bin(self) -> Dict[str, Any]:
+        """获取二进制格式的传感器数据（传输字节更少，无需JSON解析）"""
+        response = self._get("/api/sensor/bin")
+        if isinstance(response, dict):
+            return response
+        
+        try:
+            analog, voltage, button, led, relay = SENSOR_BIN_FORMAT.unpack(response.content)
+        except struct.error as e:
+            return {"error": True, "message": f"数据解析失败: {e}"}
+        
+        return {
+            "analog_value": analog,
+            "voltage": voltage,
+            "button_pressed": button,
+            "led_state": led,
+            "relay_state": relay
+        }
+    
     def get_status(self) -> Dict[str, Any]:
         """获取完整状态（设备信息 + 传感器数据）"""
+        # 优先使用合并端点，一次往返即可拿到全部状态
+        if self._batch_status:
+            status = self._send_request("/api/status")
+            if "error" not in status and "device_info" in status:
+                return status
+            if status.get("status_code") == 404:
+                self._batch_status = False  # 旧固件没有该端点
+        
+        # 回退（旧固件或本次请求失败）：分别获取，设备信息通常来自缓存
         device_info = self.get_device_info()
         sensor_data = self.get_sensor_data()
         
@@ -89,6 +279,8 @@ def print_response(response: Dict[str, Any], title: str = ""):
     
     if "error" in response and response["error"]:
         print(f"❌ 错误: {response.get('message', '未知错误')}")
+    elif orjson:
+        print(orjson.dumps(response, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode())
     else:
         print(json.dumps(response, indent=2, ensure_ascii=False))
 
@@ -96,89 +288,113 @@ def demo_automated_test(controller: ESP32Controller):
     """自动化演示测试"""
     print("🚀 开始自动化演示测试")
     
-    # 1. 获取设备信息
-    print_response(controller.get_device_info(), "设备信息")
-    time.sleep(1)
-    
-    # 2. LED控制演示
-    print_response(controller.led_control("on"), "打开LED")
-    time.sleep(1)
-    
-    print_response(controller.led_control("off"), "关闭LED")
-    time.sleep(1)
-    
-    print_response(controller.led_control("toggle"), "切换LED")
-    time.sleep(1)
-    
-    # 3. 继电器控制演示
-    print_response(controller.relay_control("on"), "打开继电器")
-    time.sleep(1)
-    
-    print_response(controller.relay_control("off"), "关闭继电器")
-    time.sleep(1)
-    
-    # 4. 传感器数据读取
-    print_response(controller.get_sensor_data(), "传感器数据")
-    time.sleep(1)
-    
-    # 5. 最终状态
-    print_response(controller.get_status(), "完整状态")
-    
+    # 结果交给打印线程格式化输出，主线程立即发出下一个请求；
+    # 离开with块时（包括Ctrl+C中断）会等待打印队列清空
+    pending: List[Future] = []
+    with ThreadPoolExecutor(max_workers=1) as printer:
+        def show(response: Dict[str, Any], title: str):
+            pending.append(printer.submit(print_response, response, title))
+        
+        def confirm(field: str, expected: bool):
+            """轮询设备状态确认写操作已生效，超时则给出警告"""
+            if not controller.wait_for(field, expected):
+                show({"error": True, "message": f"等待 {field}={expected} 超时，设备未确认状态"}, "状态确认")
+        
+        # 每次写操作后轮询设备状态，确认已生效再进行下一步，而不是固定等待
+        # 1. 获取设备信息
+        show(controller.get_device_info(), "设备信息")
+        
+        # 2. LED控制演示
+        show(controller.led_control("on"), "打开LED")
+        confirm("led_state", True)
+        
+        show(controller.led_control("off"), "关闭LED")
+        confirm("led_state", False)
+        
+        show(controller.led_control("toggle"), "切换LED")
+        
+        # 3. 继电器控制演示
+        show(controller.relay_control("on"), "打开继电器")
+        confirm("relay_state", True)
+        
+        show(controller.relay_control("off"), "关闭继电器")
+        confirm("relay_state", False)
+        
+        # 4. 传感器数据读取
+        show(controller.get_sensor_data(), "传感器数据")
+        
+        # 5. 最终状态
+        show(controller.get_status(), "完整状态")
+        
+    # 打印线程中的异常在此抛出
+    for future in pending:
+        future.result()
     print("\n✅ 自动化测试完成!")
 
+def _parse_choice(text: str, count: int) -> int:
+    """把输入的选项编号转换为菜单下标，无效时返回-1"""
+    try:
+        idx = int(text)
+    except ValueError:
+        return -1
+    return idx if 0 <= idx < count else -1
+
 def interactive_control(controller: ESP32Controller):
     """交互式控制界面"""
-    commands = {
-        "1": {"name": "📊 获取设备信息", "func": controller.get_device_info},
-        "2": {"name": "💡 LED控制", "submenu": {
-            "1": {"name": "打开LED", "func": lambda: controller.led_control("on")},
-            "2": {"name": "关闭LED", "func": lambda: controller.led_control("off")},
-            "3": {"name": "切换LED", "func": lambda: controller.led_control("toggle")}
-        }},
-        "3": {"name": "🔌 继电器控制", "submenu": {
-            "1": {"name": "打开继电器", "func": lambda: controller.relay_control("on")},
-            "2": {"name": "关闭继电器", "func": lambda: controller.relay_control("off")}
-        }},
-        "4": {"name": "📈 读取传感器数据", "func": controller.get_sensor_data},
-        "5": {"name": "🔄 获取完整状态", "func": controller.get_status},
-        "6": {"name": "🎬 自动化演示测试", "func": lambda: demo_automated_test(controller)},
-        "0": {"name": "❌ 退出程序", "func": None}
-    }
+    # 菜单表按选项编号索引: (名称, 函数或子菜单)，子菜单从1开始编号
+    commands = (
+        ("❌ 退出程序", None),
+        ("📊 获取设备信息", controller.get_device_info),
+        ("💡 LED控制", (
+            ("打开LED", lambda: controller.led_control("on")),
+            ("关闭LED", lambda: controller.led_control("off")),
+            ("切换LED", lambda: controller.led_control("toggle"))
+        )),
+        ("🔌 继电器控制", (
+            ("打开继电器", lambda: controller.relay_control("on")),
+            ("关闭继电器", lambda: controller.relay_control("off"))
+        )),
+        ("📈 读取传感器数据", controller.get_sensor_data),
+        ("🔄 获取完整状态", controller.get_status),
+        ("🎬 自动化演示测试", lambda: demo_automated_test(controller)),
+        ("📡 实时监控传感器数据", lambda: monitor_sensor_ws(controller))
+    )
     
     while True:
         print("\n" + "="*60)
         print("🎛️  ESP32 智能控制器")
         print("="*60)
         
-        # 显示主菜单
-        for key, value in commands.items():
-            print(f"{key}. {value['name']}")
+        # 显示主菜单（退出选项放在最后）
+        for idx in range(1, len(commands)):
+            print(f"{idx}. {commands[idx][0]}")
+        print(f"0. {commands[0][0]}")
         
         try:
-            choice = input("\n请输入选项编号: ").strip()
+            choice = _parse_choice(input("\n请输入选项编号: ").strip(), len(commands))
             
-            if choice == "0":
+            if choice == 0:
                 print("👋 再见！")
                 break
-            elif choice in commands:
-                if "submenu" in commands[choice]:
+            elif choice > 0:
+                name, action = commands[choice]
+                if isinstance(action, tuple):
                     # 显示子菜单
-                    submenu = commands[choice]["submenu"]
-                    print(f"\n--- {commands[choice]['name']} ---")
-                    for sub_key, sub_value in submenu.items():
-                        print(f"  {sub_key}. {sub_value['name']}")
+                    print(f"\n--- {name} ---")
+                    for sub_idx, (sub_name, _) in enumerate(action, 1):
+                        print(f"  {sub_idx}. {sub_name}")
                     
-                    sub_choice = input("请选择操作: ").strip()
-                    if sub_choice in submenu:
-                        result = submenu[sub_choice]["func"]()
-                        print_response(result, submenu[sub_choice]["name"])
+                    sub_choice = _parse_choice(input("请选择操作: ").strip(), len(action) + 1)
+                    if sub_choice > 0:
+                        sub_name, sub_func = action[sub_choice - 1]
+                        print_response(sub_func(), sub_name)
                     else:
                         print("❌ 无效的选择")
                 else:
                     # 执行直接功能
-                    result = commands[choice]["func"]()
-                    if choice != "6":  # 自动化测试自己会打印结果
-                        print_response(result, commands[choice]["name"])
+                    result = action()
+                    if choice < 6:  # 自动化测试和实时监控自己负责输出
+                        print_response(result, name)
             else:
                 print("❌ 无效的选择，请重新输入")
                 
@@ -193,25 +409,131 @@ def monitor_sensor_data(controller: ESP32Controller, interval: int = 2):
     print(f"\n📊 开始实时监控传感器数据 (每{interval}秒更新)")
     print("按 Ctrl+C 停止监控")
     
+    # 优先使用二进制端点，旧固件不支持时改用JSON端点
+    fetch = controller.get_sensor_data_bin
+    out = _BatchedWriter()
+    timestamp = _timestamp_formatter()
+    
     try:
         while True:
-            sensor_data = controller.get_sensor_data()
-            if "error" not in sensor_data:
-                print(f"\r🕒 {time.strftime('%H:%M:%S')} - " +
-                      f"模拟值: {sensor_data.get('analog_value', 'N/A'):4d} | " +
-                      f"电压: {sensor_data.get('voltage', 0):.2f}V | " +
-                      f"按钮: {'按下' if sensor_data.get('button_pressed') else '释放':3s} | " +
-                      f"LED: {'开启' if sensor_data.get('led_state') else '关闭':3s} | " +
-                      f"继电器: {'开启' if sensor_data.get('relay_state') else '关闭':3s}", 
-                      end="", flush=True)
-            else:
-                print(f"\r❌ 读取失败: {sensor_data.get('message', '未知错误')}", end="")
-            
+            sensor_data = fetch()
+            if sensor_data.get("status_code") == 404 and fetch == controller.get_sensor_data_bin:
+                fetch = controller.get_sensor_data
+                sensor_data = fetch()
+            _print_sensor_line(sensor_data, out, timestamp())
             time.sleep(interval)
             
     except KeyboardInterrupt:
+        out.flush()
         print("\n\n🛑 监控已停止")
 
+def monitor_sensor_ws(controller: ESP32Controller, interval: int = 2):
+    """通过WebSocket接收ESP32推送的传感器数据，不可用时回退到HTTP轮询"""
+    if websocket is None:
+        return monitor_sensor_data(controller, interval)
+    
+    try:
+        ws = websocket.create_connection(controller.ws_url, timeout=controller.timeout)
+    except (websocket.WebSocketException, OSError) as e:
+        print(f"⚠️ WebSocket连接失败 ({e})，改用HTTP轮询")
+        return monitor_sensor_data(controller, interval)
+    
+    print("\n📊 开始实时监控传感器数据 (WebSocket推送)")
+    print("按 Ctrl+C 停止监控")
+    
+    out = _BatchedWriter()
+    timestamp = _timestamp_formatter()
+    awaiting_pong = False
+    
+    try:
+        # 数据无变化时服务器不推送，静默期间靠ping/pong确认设备仍在线
+        ws.settimeout(WS_RECV_TIMEOUT)
+        while True:
+            try:
+                opcode, message = ws.recv_data(control_frame=True)
+            except websocket.WebSocketTimeoutException:
+                if awaiting_pong:
+                    print("\n❌ ESP32无响应，监控已停止")
+                    break
+                ws.ping()
+                awaiting_pong = True
+                continue
+            
+            awaiting_pong = False
+            if opcode == websocket.ABNF.OPCODE_CLOSE:
+                print("\n🔌 ESP32关闭了WebSocket连接")
+                break
+            if opcode != websocket.ABNF.OPCODE_TEXT:
+                continue
+            
+            _print_sensor_line(orjson.loads(message) if orjson else json.loads(message), out, timestamp())
+            out.flush()  # 推送间隔不定，收到即显示，避免最后一次更新滞留在缓冲区
+            
+    except KeyboardInterrupt:
+        print("\n\n🛑 监控已停止")
+    except (websocket.WebSocketException, OSError, json.JSONDecodeError) as e:
+        print(f"\n❌ WebSocket连接中断: {e}")
+    finally:
+        ws.close()
+
+class _BatchedWriter:
+    """
+    累积监控输出，最多每 MONITOR_FLUSH_INTERVAL 秒写一次stdout，减少系统调用
+    
+    到期检查只在write()时进行，适用于定时轮询的循环（未写出的内容最多延迟一个轮询间隔）；
+    不定时到达的输出需在写入后自行调用flush()。
+    """
+    
+    def __init__(self, interval: float = MONITOR_FLUSH_INTERVAL):
+        self._buf: List[str] = []
+        self._interval = interval
+        self._next_flush = time.monotonic()
+    
+    def write(self, text: str):
+        self._buf.append(text)
+        if time.monotonic() >= self._next_flush:
+            self.flush()
+    
+    def flush(self):
+        if self._buf:
+            sys.stdout.write("".join(self._buf))
+            sys.stdout.flush()
+            self._buf.clear()
+        self._next_flush = time.monotonic() + self._interval
+
+def _timestamp_formatter():
+    """返回一个生成当前时间 HH:MM:SS 的函数，同一秒内复用已格式化的结果"""
+    last_second = -1
+    text = ""
+    
+    def timestamp() -> str:
+        nonlocal last_second, text
+        now = int(time.time())
+        if now != last_second:
+            last_second = now
+            text = time.strftime('%H:%M:%S', time.localtime(now))
+        return text
+    
+    return timestamp
+
+def _fmt_sensor_line(d: Dict[str, Any], ts: str) -> str:
+    """生成一行传感器监控文字（纯函数，可单独用mypyc/Cython编译）"""
+    return _MON_FMT.format(
+        ts=ts,
+        a=d.get('analog_value', 'N/A'),
+        v=d.get('voltage', 0),
+        btn=_BUTTON_TEXT[bool(d.get('button_pressed'))],
+        led=_SWITCH_TEXT[bool(d.get('led_state'))],
+        relay=_SWITCH_TEXT[bool(d.get('relay_state'))]
+    )
+
+def _print_sensor_line(sensor_data: Dict[str, Any], out: _BatchedWriter, ts: str):
+    """在同一行刷新显示传感器数据"""
+    if "error" not in sensor_data:
+        out.write(_fmt_sensor_line(sensor_data, ts))
+    else:
+        out.write(f"\r❌ 读取失败: {sensor_data.get('message', '未知错误')}")
+
 def main():
     """主函数"""
     print("🌐 ESP32 Web客户端控制器")
@@ -250,6 +572,8 @@ def main():
 
 if __name__ == "__main__":
     # 安装依赖: pip install requests
+    # 可选加速: pip install orjson ijson websocket-client
+    # 实时监控(WebSocket推送)需要固件安装 arduinoWebSockets 库，未安装websocket-client时回退到HTTP轮询
     
     try:
         main()
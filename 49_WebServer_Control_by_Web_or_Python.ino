@@ -1,6 +1,10 @@
 // ESP32_WebServer.ino
+// 依赖库（Arduino库管理器安装）:
+//   - WebSockets (arduinoWebSockets, 作者 Markus Sattler / Links2004)，提供 WebSocketsServer.h
+//   - ArduinoJson (v6, 作者 Benoit Blanchon)
 #include <WiFi.h>
 #include <WebServer.h>
+#include <WebSocketsServer.h>
 #include <ArduinoJson.h>
 
 // WiFi配置
@@ -10,6 +14,12 @@ const char* password = "11111111";
 // 创建Web服务器对象，端口80
 WebServer server(80);
 
+// WebSocket服务器，端口81，向客户端推送传感器数据
+WebSocketsServer webSocket(81);
+const unsigned long wsPushInterval = 100;  // 最短推送间隔（毫秒）
+unsigned long lastWsPush = 0;
+String lastWsPayload;
+
 // 引脚定义
 const int ledPin = 27;       // LED
 const int relayPin = 4;     // 继电器控制
@@ -22,6 +32,15 @@ bool relayState = false;
 int analogValue = 0;
 bool buttonState = false;
 
+// 二进制传感器数据包（小端，共9字节），与Python客户端的 "<Hf???" 格式对应
+struct __attribute__((packed)) SensorPacket {
+  uint16_t analogValue;
+  float voltage;
+  bool buttonPressed;
+  bool ledState;
+  bool relayState;
+};
+
 void setup() {
   Serial.begin(115200);
   
@@ -41,12 +60,19 @@ void setup() {
   // 启动服务器
   server.begin();
   Serial.println("HTTP服务器已启动");
+  
+  // 启动WebSocket服务器
+  webSocket.begin();
+  webSocket.onEvent(onWebSocketEvent);
+  Serial.println("WebSocket服务器已启动 (端口81)");
   printNetworkInfo();
 }
 
 void loop() {
   server.handleClient();  // 处理客户端请求
+  webSocket.loop();       // 处理WebSocket连接
   updateSensorData();     // 更新传感器数据
+  pushSensorData();       // 推送变化的传感器数据
   delay(10);
 }
 
@@ -110,6 +136,12 @@ String html =
 "      <button onclick=\"fetchData('/api/sensor/data')\">读取传感器</button>\n"
 "    </div>\n"
 "    \n"
+"    <div class=\"endpoint\">\n"
+"      <h3>🔄 完整状态</h3>\n"
+"      <p><strong>GET</strong> <code>/api/status</code></p>\n"
+"      <button onclick=\"fetchData('/api/status')\">获取状态</button>\n"
+"    </div>\n"
+"    \n"
 "    <div id=\"result\" style=\"margin-top: 20px; padding: 15px; background: #e8f4fd; border-radius: 5px;\"></div>\n"
 "    \n"
 "    <script>\n"
@@ -135,11 +167,7 @@ void setupRoutes() {
   // 获取设备信息
   server.on("/api/device/info", HTTP_GET, []() {
     DynamicJsonDocument doc(1024);
-    doc["device"] = "ESP32";
-    doc["ip"] = WiFi.localIP().toString();
-    doc["mac"] = WiFi.macAddress();
-    doc["free_heap"] = ESP.getFreeHeap();
-    doc["chip_id"] = ESP.getEfuseMac();
+    fillDeviceInfo(doc.to<JsonObject>());
     
     String response;
     serializeJson(doc, response);
@@ -181,11 +209,30 @@ void setupRoutes() {
   // 传感器数据
   server.on("/api/sensor/data", HTTP_GET, []() {
     DynamicJsonDocument doc(512);
-    doc["analog_value"] = analogValue;
-    doc["voltage"] = (analogValue * 3.3) / 4095.0;
-    doc["button_pressed"] = buttonState;
-    doc["led_state"] = ledState;
-    doc["relay_state"] = relayState;
+    fillSensorData(doc.to<JsonObject>());
+    
+    String response;
+    serializeJson(doc, response);
+    server.send(200, "application/json", response);
+  });
+
+  // 传感器数据（二进制），供高频监控使用
+  server.on("/api/sensor/bin", HTTP_GET, []() {
+    SensorPacket packet;
+    packet.analogValue = analogValue;
+    packet.voltage = (analogValue * 3.3) / 4095.0;
+    packet.buttonPressed = buttonState;
+    packet.ledState = ledState;
+    packet.relayState = relayState;
+    
+    server.send_P(200, "application/octet-stream", (const char*)&packet, sizeof(packet));
+  });
+
+  // 完整状态（设备信息 + 传感器数据），一次请求返回
+  server.on("/api/status", HTTP_GET, []() {
+    DynamicJsonDocument doc(1536);
+    fillDeviceInfo(doc.createNestedObject("device_info"));
+    fillSensorData(doc.createNestedObject("sensor_data"));
     
     String response;
     serializeJson(doc, response);
@@ -204,6 +251,22 @@ void setupRoutes() {
   });
 }
 
+void fillDeviceInfo(JsonObject obj) {
+  obj["device"] = "ESP32";
+  obj["ip"] = WiFi.localIP().toString();
+  obj["mac"] = WiFi.macAddress();
+  obj["free_heap"] = ESP.getFreeHeap();
+  obj["chip_id"] = ESP.getEfuseMac();
+}
+
+void fillSensorData(JsonObject obj) {
+  obj["analog_value"] = analogValue;
+  obj["voltage"] = (analogValue * 3.3) / 4095.0;
+  obj["button_pressed"] = buttonState;
+  obj["led_state"] = ledState;
+  obj["relay_state"] = relayState;
+}
+
 void sendSuccessResponse(const String& message) {
   DynamicJsonDocument doc(256);
   doc["success"] = true;
@@ -221,6 +284,30 @@ void updateSensorData() {
   buttonState = digitalRead(buttonPin);
 }
 
+void onWebSocketEvent(uint8_t num, WStype_t type, uint8_t* payload, size_t length) {
+  if (type == WStype_CONNECTED) {
+    lastWsPayload = "";  // 新客户端连接后立即推送一次当前状态
+  }
+}
+
+void pushSensorData() {
+  if (webSocket.connectedClients() == 0 || millis() - lastWsPush < wsPushInterval) {
+    return;
+  }
+  lastWsPush = millis();
+  
+  DynamicJsonDocument doc(512);
+  fillSensorData(doc.to<JsonObject>());
+  
+  String payload;
+  serializeJson(doc, payload);
+  if (payload == lastWsPayload) {
+    return;  // 数据无变化，不推送
+  }
+  lastWsPayload = payload;
+  webSocket.broadcastTXT(payload);
+}
+
 void printNetworkInfo() {
   Serial.println("=== 网络信息 ===");
   Serial.print("IP地址: ");